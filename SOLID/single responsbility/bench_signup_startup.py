@@ -0,0 +1,95 @@
+"""
+Cold-start benchmark for user_signup_refactor.
+
+Measures, in fresh interpreters:
+- import time of the module
+- first build_signup_service() call vs. memoized calls, both with the
+  env-default path (Config re-read per call) and a Config passed in
+- warm_up() (schema creation, first connection)
+
+Run: python bench_signup_startup.py [--runs N]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+_PROBE = r"""
+import json, os, sys, tempfile, time
+sys.path.insert(0, sys.argv[1])
+with tempfile.TemporaryDirectory() as tmp:
+    os.environ["DB_PATH"] = os.path.join(tmp, "bench.db")
+
+    t0 = time.perf_counter()
+    import user_signup_refactor as m
+    t1 = time.perf_counter()
+    service = m.build_signup_service()
+    t2 = time.perf_counter()
+    for _ in range(1000):
+        assert m.build_signup_service() is service
+    t3 = time.perf_counter()
+    config = m.Config.from_env()
+    for _ in range(1000):
+        assert m.build_signup_service(config) is service
+    t4 = time.perf_counter()
+    service.warm_up()
+    t5 = time.perf_counter()
+
+    print(json.dumps({
+        "import_ms": (t1 - t0) * 1e3,
+        "first_build_ms": (t2 - t1) * 1e3,
+        "memoized_env_build_us": (t3 - t2) * 1e6 / 1000,
+        "memoized_config_build_us": (t4 - t3) * 1e6 / 1000,
+        "warm_up_ms": (t5 - t4) * 1e3,
+    }))
+"""
+
+
+def run_once() -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE, str(HERE)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out)
+
+
+def heavy_modules_loaded_at_import() -> list:
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); import user_signup_refactor; "
+        "print(','.join(m for m in ('smtplib', 'email.message', 'sqlite3', 'hashlib', 'logging') "
+        "if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code, str(HERE)], check=True, capture_output=True, text=True
+    ).stdout.strip()
+    return [m for m in out.split(",") if m]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    samples = [run_once() for _ in range(args.runs)]
+    for key in (
+        "import_ms",
+        "first_build_ms",
+        "memoized_env_build_us",
+        "memoized_config_build_us",
+        "warm_up_ms",
+    ):
+        values = [s[key] for s in samples]
+        print(f"{key:<26} median={statistics.median(values):8.3f}  min={min(values):8.3f}")
+    print(f"heavy modules loaded at import: {heavy_modules_loaded_at_import() or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
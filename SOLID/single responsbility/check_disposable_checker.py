@@ -0,0 +1,198 @@
+"""
+Runnable check for DisposableDomainChecker in user_signup.py.
+
+Drives the checker through a stub http_get and a local http.server:
+- TTL / error-TTL expiry with an injected clock
+- coalescing: N concurrent callers -> exactly one lookup
+- prefetch results
+- LRU bound on the cache
+- a bad response does not wedge later callers
+- signup_and_welcome rejects a disposable verdict
+
+Run: python check_disposable_checker.py
+"""
+from __future__ import annotations
+
+import http.server
+import os
+import tempfile
+import threading
+import time
+
+from user_signup import DisposableDomainChecker, signup_and_welcome
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StubHttp:
+    def __init__(self, *, fail: bool = False, delay: float = 0.0) -> None:
+        self.calls = []
+        self.fail = fail
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, url: str, timeout: float) -> str:
+        with self._lock:
+            self.calls.append(url)
+        time.sleep(self.delay)
+        if self.fail:
+            raise OSError("endpoint down")
+        return "disposable=true" if "mailinator" in url else "disposable=false"
+
+
+def check_ttl() -> None:
+    clock, http = FakeClock(), StubHttp()
+    checker = DisposableDomainChecker(http_get=http, ttl=60, clock=clock)
+    assert checker.is_disposable("mailinator.com") is True
+    assert checker.is_disposable("Mailinator.com ") is True
+    assert len(http.calls) == 1
+    clock.now = 61
+    assert checker.is_disposable("mailinator.com") is True
+    assert len(http.calls) == 2
+
+
+def check_error_ttl() -> None:
+    clock, http = FakeClock(), StubHttp(fail=True)
+    checker = DisposableDomainChecker(http_get=http, ttl=60, error_ttl=5, clock=clock)
+    assert checker.is_disposable("x.com") is None
+    assert checker.is_disposable("x.com") is None
+    assert len(http.calls) == 1
+    clock.now = 6
+    http.fail = False
+    assert checker.is_disposable("x.com") is False
+    assert len(http.calls) == 2
+
+
+def check_coalescing() -> None:
+    http = StubHttp(delay=0.2)
+    checker = DisposableDomainChecker(http_get=http)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(checker.is_disposable("mailinator.com")))
+        for _ in range(20)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [True] * 20
+    assert len(http.calls) == 1
+
+
+def check_prefetch() -> None:
+    http = StubHttp(delay=0.05)
+    checker = DisposableDomainChecker(http_get=http)
+    verdicts = checker.prefetch(["a.com", "B.com", "mailinator.com", "a.com", ""])
+    assert verdicts == {"a.com": False, "b.com": False, "mailinator.com": True}
+    assert len(http.calls) == 3
+    assert checker.is_disposable("b.com") is False
+    assert len(http.calls) == 3
+
+
+def check_lru_bound() -> None:
+    http = StubHttp()
+    checker = DisposableDomainChecker(http_get=http, max_entries=3)
+    for d in ("a.com", "b.com", "c.com"):
+        checker.is_disposable(d)
+    checker.is_disposable("a.com")  # refresh a.com
+    checker.is_disposable("d.com")  # evicts b.com, the least recently used
+    assert len(http.calls) == 4
+    checker.is_disposable("a.com")
+    assert len(http.calls) == 4
+    checker.is_disposable("b.com")
+    assert len(http.calls) == 5
+
+
+def _returns_promptly(fn, timeout: float = 2.0) -> bool:
+    outcome = []
+
+    def run() -> None:
+        try:
+            outcome.append(fn())
+        except Exception as e:
+            outcome.append(e)
+
+    t = threading.Thread(target=run, daemon=True)
+    t.start()
+    t.join(timeout)
+    return not t.is_alive()
+
+
+def check_bad_response_does_not_wedge() -> None:
+    checker = DisposableDomainChecker(http_get=lambda url, timeout: b"disposable=true")
+    assert checker.is_disposable("x.com") is None
+    assert _returns_promptly(lambda: checker.is_disposable("x.com"))
+
+    def broken_clock() -> float:
+        raise RuntimeError("clock broke")
+
+    checker = DisposableDomainChecker(http_get=StubHttp(), clock=broken_clock)
+    try:
+        checker.is_disposable("y.com")
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected RuntimeError")
+    assert _returns_promptly(lambda: checker.is_disposable("y.com"))
+
+
+def check_local_server_and_signup() -> None:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            body = b"disposable=true" if "mailinator" in self.path else b"disposable=false"
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        checker = DisposableDomainChecker(endpoint=f"http://127.0.0.1:{server.server_port}/check")
+        assert checker.is_disposable("mailinator.com") is True
+        assert checker.is_disposable("example.org") is False
+
+        cwd = os.getcwd()
+        old_db_path = os.environ.get("DB_PATH")
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            os.environ["DB_PATH"] = os.path.join(tmp, "app.db")
+            try:
+                signup_and_welcome(
+                    {"email": "bot@mailinator.com", "password": "x" * 12, "full_name": "Bot"},
+                    checker=checker,
+                )
+            except ValueError as e:
+                assert str(e) == "Disposable email is not allowed"
+            else:
+                raise AssertionError("disposable signup was accepted")
+            finally:
+                os.chdir(cwd)
+                if old_db_path is None:
+                    os.environ.pop("DB_PATH", None)
+                else:
+                    os.environ["DB_PATH"] = old_db_path
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    for check in (
+        check_ttl,
+        check_error_ttl,
+        check_coalescing,
+        check_prefetch,
+        check_lru_bound,
+        check_bad_response_does_not_wedge,
+        check_local_server_and_signup,
+    ):
+        check()
+        print(f"ok  {check.__name__}")
@@ -6,13 +6,144 @@ import hashlib
 import sqlite3
 import smtplib
 import logging
+import threading
+import time
+import urllib.parse
 import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from email.message import EmailMessage
 from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
 
 
-def signup_and_welcome(payload: dict) -> dict:
+# (url, timeout) -> response body. Swap in a stub to test against a local server.
+HttpGet = Callable[[str, float], str]
+
+
+def urllib_http_get(url: str, timeout: float) -> str:
+    with urllib.request.urlopen(url, timeout=timeout) as resp:
+        return resp.read().decode("utf-8", errors="ignore")
+
+
+class _InFlight:
+    """One pending lookup; the leader fills a slot, then sets `done`."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.verdict: Optional[bool] = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> Optional[bool]:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.verdict
+
+
+class DisposableDomainChecker:
+    """
+    Disposable-domain lookups over HTTP, cached per domain:
+    - verdicts (True/False) are kept for `ttl` seconds
+    - failed lookups are cached as None (unknown) for `error_ttl` seconds,
+      so a down endpoint is not hit on every signup
+    - at most `max_entries` domains are kept; the least recently used one is
+      evicted first, so random-domain signups cannot grow the cache unbounded
+    - concurrent callers for the same domain share one in-flight request
+    """
+
+    def __init__(
+        self,
+        *,
+        endpoint: str = "https://example.com/disposable-check",
+        http_get: HttpGet = urllib_http_get,
+        timeout: float = 1.5,
+        ttl: float = 3600.0,
+        error_ttl: float = 30.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.endpoint = endpoint
+        self._http_get = http_get
+        self._timeout = timeout
+        self._ttl = ttl
+        self._error_ttl = error_ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()  # domain -> (verdict, expires_at)
+        self._inflight: Dict[str, _InFlight] = {}
+
+    def is_disposable(self, domain: str) -> Optional[bool]:
+        """True/False when known, None when the lookup failed (fail open)."""
+        domain = domain.strip().lower()
+        with self._lock:
+            hit = self._cache.get(domain)
+            if hit is not None:
+                if hit[1] > self._clock():
+                    self._cache.move_to_end(domain)
+                    return hit[0]
+                del self._cache[domain]
+            pending = self._inflight.get(domain)
+            leader = pending is None
+            if leader:
+                pending = _InFlight()
+                self._inflight[domain] = pending
+
+        if not leader:
+            return pending.wait()
+
+        # Followers are parked on `pending`: it must be completed and the
+        # in-flight entry dropped whatever happens, or they wait forever.
+        try:
+            verdict = self._lookup(domain)
+            with self._lock:
+                self._store(domain, verdict)
+        except BaseException as exc:
+            pending.error = exc
+            raise
+        else:
+            pending.verdict = verdict
+            return verdict
+        finally:
+            pending.done.set()
+            with self._lock:
+                self._inflight.pop(domain, None)
+
+    def prefetch(self, domains: Iterable[str], max_workers: int = 8) -> Dict[str, Optional[bool]]:
+        """Warm the cache for a bulk import; returns the verdict per domain."""
+        unique = sorted({d.strip().lower() for d in domains if d and d.strip()})
+        if not unique:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as pool:
+            return dict(zip(unique, pool.map(self.is_disposable, unique)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _store(self, domain: str, verdict: Optional[bool]) -> None:
+        ttl = self._error_ttl if verdict is None else self._ttl
+        self._cache[domain] = (verdict, self._clock() + ttl)
+        self._cache.move_to_end(domain)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+    def _lookup(self, domain: str) -> Optional[bool]:
+        url = f"{self.endpoint}?{urllib.parse.urlencode({'domain': domain})}"
+        try:
+            body = self._http_get(url, self._timeout)
+            return "disposable=true" in body
+        except Exception:
+            # swallow network errors and malformed responses to not block signup
+            return None
+
+
+_default_checker = DisposableDomainChecker()
+
+
+def signup_and_welcome(payload: dict, checker: Optional[DisposableDomainChecker] = None) -> dict:
     """
     A real-world-ish mess:
     - reads env config
@@ -73,16 +204,9 @@ def signup_and_welcome(payload: dict) -> dict:
     # 4) External check: disposable email domain check via HTTP (changes by provider/endpoint)
     if allow_disposable_check:
         domain = email.split("@")[-1]
-        # fake-ish endpoint for exercise purpose
-        url = f"https://example.com/disposable-check?domain={domain}"
-        try:
-            with urllib.request.urlopen(url, timeout=1.5) as resp:
-                body = resp.read().decode("utf-8", errors="ignore")
-                if "disposable=true" in body:
-                    raise ValueError("Disposable email is not allowed")
-        except Exception:
-            # swallow network errors to not block signup
-            pass
+        # fake-ish endpoint for exercise purpose; verdicts are cached per domain
+        if (checker or _default_checker).is_disposable(domain):
+            raise ValueError("Disposable email is not allowed")
 
     # 5) Security: password hashing policy (changes by security)
     password_hash = hashlib.sha256((salt + password).encode("utf-8")).hexdigest()
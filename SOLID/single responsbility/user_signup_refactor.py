@@ -1,18 +1,21 @@
 from __future__ import annotations
 
-import hashlib
 import json
-import logging
 import os
 import re
-import sqlite3
+import threading
 from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from email.message import EmailMessage
 from pathlib import Path
-import smtplib
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional
+
+# smtplib, email, sqlite3, hashlib and logging are imported on first use so
+# short-lived workers only pay for what a given invocation actually touches.
+if TYPE_CHECKING:
+    import logging
+    import sqlite3
+    from email.message import EmailMessage
 
 @dataclass(frozen=True)
 class UserDraft:
@@ -79,6 +82,8 @@ class SignupValidator:
 class PasswordHasher:
     @staticmethod
     def hash(password: str, salt: str) -> str:
+        import hashlib
+
         return hashlib.sha256((salt + password).encode("utf-8")).hexdigest()
 
 
@@ -122,6 +127,8 @@ class UserRepository:
         self.db_path = db_path
 
     def _connect(self) -> sqlite3.Connection:
+        import sqlite3
+
         return sqlite3.connect(self.db_path)
 
     def ensure_schema(self) -> None:
@@ -175,6 +182,8 @@ class EmailService:
         self.email_from = email_from
 
     def build_welcome(self, *, to: str, full_name: str, user_id: int) -> EmailMessage:
+        from email.message import EmailMessage
+
         msg = EmailMessage()
         msg["From"] = self.email_from
         msg["To"] = to
@@ -183,12 +192,26 @@ class EmailService:
         return msg
 
     def send(self, msg: EmailMessage) -> None:
+        import smtplib
+
         with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=2) as server:
             server.send_message(msg)
 
 class Logger:
     def __init__(self, name: str = "signup"):
-        self._logger = logging.getLogger(name)
+        self._name = name
+        self._logger_instance: Optional["logging.Logger"] = None
+
+    @property
+    def _logger(self) -> "logging.Logger":
+        if self._logger_instance is None:
+            import logging
+
+            self._logger_instance = logging.getLogger(self._name)
+        return self._logger_instance
+
+    def warm(self) -> None:
+        self._logger
 
     def info(self, message: str, extra: Optional[dict] = None) -> None:
         self._logger.info(message, extra=extra)
@@ -221,6 +244,14 @@ class SignupService:
         self.validator = validator
         self.hasher = hasher
 
+    def warm_up(self) -> None:
+        """Pay one-off startup costs ahead of the first request."""
+        self.repo.ensure_schema()
+        self.logger.warm()
+        import email.message  # noqa: F401
+        import hashlib  # noqa: F401
+        import smtplib  # noqa: F401
+
     def signup(self, payload: dict) -> dict:
         draft = self.validator.normalize_and_validate(payload)
         self.limiter.check_and_increment()
@@ -246,8 +277,45 @@ class SignupService:
         self.logger.info("user_registered", extra={"user_id": user_id, "email": draft.email})
         return {"id": user_id, "email": draft.email, "full_name": draft.full_name, "created_at": created_at}
 
-def build_signup_service() -> SignupService:
-    config = Config.from_env()
+_services: Dict[Config, SignupService] = {}
+_services_lock = threading.Lock()
+
+
+def build_signup_service(config: Optional[Config] = None, *, warm: bool = False) -> SignupService:
+    """
+    Return the service graph for `config`, built once per Config.
+
+    Without a config the environment is re-read on every call (so env changes
+    still apply); for the fully build-once path, call Config.from_env() once at
+    startup and pass that Config in. Each distinct Config keeps its graph for
+    the life of the process, so env changes on the default path add entries
+    until reset_signup_services() is called.
+
+    With warm=True, warm_up() runs only when the graph is first built.
+    """
+    if config is None:
+        config = Config.from_env()
+
+    service = _services.get(config)
+    if service is None:
+        with _services_lock:
+            service = _services.get(config)
+            if service is None:
+                service = _create_signup_service(config)
+                if warm:
+                    service.warm_up()
+                _services[config] = service
+
+    return service
+
+
+def reset_signup_services() -> None:
+    """Drop every memoized service graph (tests, config reloads, rotated DB files)."""
+    with _services_lock:
+        _services.clear()
+
+
+def _create_signup_service(config: Config) -> SignupService:
     repo = UserRepository(config.db_path)
     email_service = EmailService(config.smtp_host, config.smtp_port, config.email_from)
     logger = Logger("signup")